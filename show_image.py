@@ -9,14 +9,19 @@ Simplified version with 3 main options:
 Requirements:
 - PIL (Pillow) with ImageGrab support
 - OpenCV (cv2) for video support
+- mss (optional) for faster screen capture; falls back to ImageGrab
 - On Linux: may need additional packages for screen capture
 - On macOS: requires screen recording permissions
 - On Windows: should work out of the box
 """
 
+import mmap
 import numpy as np
 import os
+import queue
+import signal
 import sys
+import threading
 import time
 from PIL import Image, ImageGrab
 
@@ -29,6 +34,13 @@ except ImportError:
     print("⚠️  OpenCV no está instalado. El soporte de video estará deshabilitado.")
     print("   Instala con: pip install opencv-python")
 
+# Try to import mss for faster screen capture (ImageGrab is the fallback)
+try:
+    import mss
+    HAS_MSS = True
+except ImportError:
+    HAS_MSS = False
+
 # Resolution configurations
 RESOLUTIONS = {
     '800x600': {
@@ -53,6 +65,40 @@ RESOLUTIONS = {
 DEFAULT_RESOLUTION = '800x600'
 BYTES_PER_PIXEL = 3
 
+# Resampling filters for resize_image (select with GM12U320_FILTER=<name>)
+RESAMPLE_FILTERS = {
+    'nearest': Image.Resampling.NEAREST,
+    'box': Image.Resampling.BOX,
+    'bilinear': Image.Resampling.BILINEAR,
+    'hamming': Image.Resampling.HAMMING,
+    'bicubic': Image.Resampling.BICUBIC,
+    'lanczos': Image.Resampling.LANCZOS,
+}
+RESAMPLE_FILTER_NAME = os.environ.get('GM12U320_FILTER', 'nearest').lower()
+# True only for a valid filter chosen by the user (not the default/fallback)
+RESAMPLE_FILTER_FROM_ENV = 'GM12U320_FILTER' in os.environ
+if RESAMPLE_FILTER_NAME not in RESAMPLE_FILTERS:
+    print(f"⚠️  Filtro de escalado desconocido: {RESAMPLE_FILTER_NAME}, usando nearest")
+    print(f"   Disponibles: {', '.join(RESAMPLE_FILTERS.keys())}")
+    RESAMPLE_FILTER_NAME = 'nearest'
+    RESAMPLE_FILTER_FROM_ENV = False
+RESAMPLE_FILTER = RESAMPLE_FILTERS[RESAMPLE_FILTER_NAME]
+
+# Closest OpenCV interpolation for each filter. Arrays resized through
+# resize_image always use it (nearest by default, like the Pillow path);
+# video frames use it only when GM12U320_FILTER is set
+CV2_INTERPOLATIONS = {
+    'nearest': 'INTER_NEAREST',
+    'box': 'INTER_AREA',
+    'bilinear': 'INTER_LINEAR',
+    'hamming': 'INTER_LINEAR',
+    'bicubic': 'INTER_CUBIC',
+    'lanczos': 'INTER_LANCZOS4',
+}
+
+# Shared image file read by the driver
+OUTPUT_FILE = "/tmp/gm12u320_image.rgb"
+
 # Global resolution settings (will be set by command line)
 PROJECTOR_WIDTH = RESOLUTIONS[DEFAULT_RESOLUTION]['width']
 PROJECTOR_HEIGHT = RESOLUTIONS[DEFAULT_RESOLUTION]['height']
@@ -61,10 +107,35 @@ DATA_BYTES_PER_LINE = RESOLUTIONS[DEFAULT_RESOLUTION]['data_bytes_per_line']
 PADDING_BYTES_PER_LINE = RESOLUTIONS[DEFAULT_RESOLUTION]['padding_bytes_per_line']
 TOTAL_FILE_SIZE = RESOLUTIONS[DEFAULT_RESOLUTION]['total_size']
 
+# Reusable frame buffer with proper stride; its padding columns are zeroed
+# once when allocated and never written again. The frame producers return
+# this buffer, so its contents are only valid until the next frame is built
+frame_buffer = np.zeros((PROJECTOR_HEIGHT, STRIDE_BYTES_PER_LINE), dtype=np.uint8)
+
+# Per-column (R) and per-row (G) base values of the test pattern, (x*255) % 256
+# and (y*255) % 256; only the per-frame offset changes between frames
+test_pattern_r_base = (np.arange(PROJECTOR_WIDTH) * 255 % 256).astype(np.uint8)
+test_pattern_g_base = (np.arange(PROJECTOR_HEIGHT) * 255 % 256).astype(np.uint8)
+
+# Error pattern frame; it never changes, so it is built on first use and
+# kept until the resolution changes
+error_pattern_buffer = None
+
+# mss screen grabber, created on first capture and reused for every frame
+# (mss instances must stay in the thread that created them)
+screen_grabber = None
+
+# Output file mapping (opened once and reused for every frame)
+output_fd = -1
+output_map = None
+output_map_file = None
+
 def set_resolution(resolution_name):
     """Set the global resolution settings"""
     global PROJECTOR_WIDTH, PROJECTOR_HEIGHT, STRIDE_BYTES_PER_LINE
     global DATA_BYTES_PER_LINE, PADDING_BYTES_PER_LINE, TOTAL_FILE_SIZE
+    global frame_buffer, test_pattern_r_base, test_pattern_g_base
+    global error_pattern_buffer
     
     if resolution_name not in RESOLUTIONS:
         print(f"Invalid resolution: {resolution_name}")
@@ -79,6 +150,12 @@ def set_resolution(resolution_name):
     PADDING_BYTES_PER_LINE = config['padding_bytes_per_line']
     TOTAL_FILE_SIZE = config['total_size']
     
+    # Allocate the frame buffer once per resolution instead of once per frame
+    frame_buffer = np.zeros((PROJECTOR_HEIGHT, STRIDE_BYTES_PER_LINE), dtype=np.uint8)
+    test_pattern_r_base = (np.arange(PROJECTOR_WIDTH) * 255 % 256).astype(np.uint8)
+    test_pattern_g_base = (np.arange(PROJECTOR_HEIGHT) * 255 % 256).astype(np.uint8)
+    error_pattern_buffer = None
+    
     print(f"Resolution set to: {resolution_name}")
     print(f"Dimensions: {PROJECTOR_WIDTH}x{PROJECTOR_HEIGHT}")
     print(f"Stride: {STRIDE_BYTES_PER_LINE} bytes per line")
@@ -91,6 +168,10 @@ def load_image_from_path(image_path):
         print(f"📷 Cargando imagen: {image_path}")
         image = Image.open(image_path)
         print(f"   Imagen cargada: {image.size[0]}x{image.size[1]} píxeles")
+        # For JPEG, let libjpeg scale down (1/2, 1/4, 1/8) while decoding
+        # instead of decoding full size and discarding pixels in resize.
+        # No-op for other formats
+        image.draft('RGB', (PROJECTOR_WIDTH, PROJECTOR_HEIGHT))
         return image
     except Exception as e:
         print(f"❌ Error cargando imagen: {e}")
@@ -139,66 +220,139 @@ def load_video_frame(video_path, frame_number=0):
         return None
 
 def resize_image(image, target_width, target_height):
-    """Resize image to exact projector resolution - OPTIMIZED"""
+    """Resize PIL image or numpy array to exact projector resolution - OPTIMIZED"""
     try:
-        # Use faster resampling for better performance
-        resized_image = image.resize((target_width, target_height), Image.Resampling.NEAREST)
+        # Arrays (mss captures) go straight to OpenCV's SIMD resize instead of
+        # a PIL round trip, with the same filter the Pillow path would use
+        if isinstance(image, np.ndarray):
+            interpolation = getattr(cv2, CV2_INTERPOLATIONS[RESAMPLE_FILTER_NAME])
+            return resize_frame(image, target_width, target_height, interpolation)
+        
+        # Already at projector resolution (e.g. an 800x600 desktop): nothing to do
+        if image.size == (target_width, target_height):
+            return image
+        
+        # Drop alpha before a filtering resize: Pillow would otherwise
+        # premultiply it and filter a 4th channel the packer throws away.
+        # NEAREST only touches output pixels, so there converting the small
+        # result later (in create_rgb_buffer_with_stride) stays cheaper
+        if image.mode == 'RGBA' and RESAMPLE_FILTER != Image.Resampling.NEAREST:
+            image = image.convert('RGB')
+        
+        # NEAREST by default for performance; GM12U320_FILTER trades speed for quality
+        resized_image = image.resize((target_width, target_height), RESAMPLE_FILTER)
         return resized_image
     except Exception as e:
         print(f"Error resizing image: {e}")
         return None
 
-def create_rgb_buffer_with_stride(image, verbose=True):
-    """Convert PIL image to RGB buffer with proper stride and padding - OPTIMIZED"""
+def resize_frame(frame, target_width, target_height, interpolation=None):
+    """Resize an OpenCV frame (numpy array) to projector resolution"""
     try:
-        # Convert to RGB if needed
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
-        
-        # Convert to numpy array
-        array = np.array(image, dtype=np.uint8)
-        
-        # Create output buffer with proper stride - OPTIMIZED
-        output_buffer = np.zeros((PROJECTOR_HEIGHT, STRIDE_BYTES_PER_LINE), dtype=np.uint8)
+        if frame.shape[1] == target_width and frame.shape[0] == target_height:
+            return frame
         
-        # Copy RGB data and convert to BGR in one operation
-        # array shape is (height, width, 3) - RGB
-        # We need BGR order and proper stride
-        for y in range(PROJECTOR_HEIGHT):
-            # Copy RGB data and convert to BGR in one slice operation
-            output_buffer[y, 0:DATA_BYTES_PER_LINE:3] = array[y, :, 2]  # B (was R)
-            output_buffer[y, 1:DATA_BYTES_PER_LINE:3] = array[y, :, 1]  # G
-            output_buffer[y, 2:DATA_BYTES_PER_LINE:3] = array[y, :, 0]  # R (was B)
-        
-        # Padding is already zeros from np.zeros()
+        # Without an explicit interpolation, honour GM12U320_FILTER if set;
+        # otherwise INTER_AREA averages source pixels when shrinking and
+        # INTER_LINEAR is used for enlarging
+        if interpolation is None:
+            if RESAMPLE_FILTER_FROM_ENV:
+                interpolation = getattr(cv2, CV2_INTERPOLATIONS[RESAMPLE_FILTER_NAME])
+            elif frame.shape[1] > target_width or frame.shape[0] > target_height:
+                interpolation = cv2.INTER_AREA
+            else:
+                interpolation = cv2.INTER_LINEAR
+        return cv2.resize(frame, (target_width, target_height), interpolation=interpolation)
+    except Exception as e:
+        print(f"Error resizing frame: {e}")
+        return None
+
+def create_rgb_buffer_with_stride(image, verbose=True, src_is_bgr=False):
+    """Convert PIL image or RGB numpy array to RGB buffer with proper stride and padding - OPTIMIZED
+    
+    Set src_is_bgr for arrays already in BGR order (OpenCV frames), which
+    are then copied as-is instead of having their channels reversed.
+    """
+    try:
+        if isinstance(image, np.ndarray):
+            # Reuse the frame buffer; the data region is fully overwritten
+            # below and the padding is already zeros
+            output_buffer = frame_buffer
+            
+            # Write straight into a (height, width, 3) view of the data region:
+            # BGR arrays are copied as-is, RGB arrays get the channel axis reversed
+            data_view = output_buffer[:, :DATA_BYTES_PER_LINE].reshape(PROJECTOR_HEIGHT, PROJECTOR_WIDTH, 3)
+            image = image[:, :, :3]  # drop alpha from 4-channel (mss BGRA) frames
+            data_view[...] = image if src_is_bgr else image[:, :, ::-1]
+        else:
+            # Convert to RGB if needed
+            if image.mode != 'RGB':
+                image = image.convert('RGB')
+            
+            # Pillow's raw encoder swaps to BGR and zero-pads every line to
+            # the stride in a single C pass, giving the final frame layout
+            output_buffer = image.tobytes('raw', 'BGR', STRIDE_BYTES_PER_LINE)
         
         if verbose:
-            print(f"Buffer created: {output_buffer.nbytes} bytes")
+            print(f"Buffer created: {len(memoryview(output_buffer).cast('B'))} bytes")
             print(f"Expected size: {TOTAL_FILE_SIZE} bytes")
             print(f"Data bytes per line: {DATA_BYTES_PER_LINE}")
             print(f"Padding bytes per line: {PADDING_BYTES_PER_LINE}")
             print(f"Total stride per line: {STRIDE_BYTES_PER_LINE}")
             print(f"Color order: BGR (optimized)")
         
-        return output_buffer.tobytes()
+        return output_buffer
     except Exception as e:
         print(f"Error creating RGB buffer: {e}")
         return None
 
+def grab_screen_mss():
+    """Grab the main monitor with a persistent mss instance"""
+    global screen_grabber, HAS_MSS
+    
+    try:
+        if screen_grabber is None:
+            screen_grabber = mss.mss()
+        shot = screen_grabber.grab(screen_grabber.monitors[1])
+        if HAS_OPENCV:
+            # Zero-copy BGRA view of the grab; cv2.resize handles 4 channels
+            # and the packer drops alpha, so the pixels never pass through PIL
+            return np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        # mss returns BGRA; Pillow drops alpha and reorders in one C pass
+        return Image.frombytes('RGB', shot.size, shot.bgra, 'raw', 'BGRX')
+    except Exception as e:
+        print(f"⚠️  mss falló ({e}), usando ImageGrab")
+        HAS_MSS = False
+        screen_grabber = None
+        return None
+
+def get_image_size(image):
+    """Return (width, height) of a PIL image or numpy array"""
+    if isinstance(image, np.ndarray):
+        return (image.shape[1], image.shape[0])
+    return image.size
+
 def capture_screen():
-    """Capture screen using PIL ImageGrab (cross-platform)"""
+    """Capture screen using mss if available, otherwise PIL ImageGrab (cross-platform)
+    
+    With mss and OpenCV the capture is a BGRA numpy array, otherwise a PIL image.
+    """
     try:
-        # Capture the entire screen
-        image = ImageGrab.grab()
+        # Capture the main screen; mss keeps its display connection and
+        # buffers across frames instead of setting them up on every grab
+        image = grab_screen_mss() if HAS_MSS else None
+        if image is None:
+            image = ImageGrab.grab()
         
         # Validate the captured image
-        if image is None or image.size[0] == 0 or image.size[1] == 0:
+        if image is None or 0 in get_image_size(image):
             print("⚠️  Screen capture returned invalid image")
             return None
             
         # Check if image has valid dimensions
-        if image.size[0] < 100 or image.size[1] < 100:
-            print(f"⚠️  Screen capture returned suspicious size: {image.size}")
+        width, height = get_image_size(image)
+        if width < 100 or height < 100:
+            print(f"⚠️  Screen capture returned suspicious size: {(width, height)}")
             return None
             
         return image
@@ -226,9 +380,38 @@ def capture_screen_with_retry(max_retries=3):
     print("❌ All screen capture attempts failed")
     return None
 
+def screen_capture_worker(frame_queue, frame_request, stop_event):
+    """Capture and resize screen frames in a background thread.
+    
+    Grabs one frame each time the main loop sets frame_request and puts a
+    (screen_size, resized_image) tuple on frame_queue, or (None, None) when
+    the capture fails, so the main loop can pack and write one frame while
+    the next one is being grabbed. The main loop alone paces the FPS; only
+    the latest frame is kept.
+    """
+    while True:
+        frame_request.wait()
+        if stop_event.is_set():
+            break
+        frame_request.clear()
+        
+        image = capture_screen_with_retry(max_retries=1)
+        item = (None, None)
+        if image is not None:
+            resized_image = resize_image(image, PROJECTOR_WIDTH, PROJECTOR_HEIGHT)
+            if resized_image is not None:
+                item = (get_image_size(image), resized_image)
+        
+        # Drop a frame the main loop has not picked up yet: it is already stale
+        try:
+            frame_queue.get_nowait()
+        except queue.Empty:
+            pass
+        frame_queue.put(item)
+
 def monitor_performance(frame_count, start_time, image_size=None):
     """Monitor and display performance statistics"""
-    elapsed = time.time() - start_time
+    elapsed = time.monotonic() - start_time
     actual_fps = frame_count / elapsed if elapsed > 0 else 0
     
     if image_size:
@@ -239,60 +422,99 @@ def monitor_performance(frame_count, start_time, image_size=None):
 def create_test_pattern(frame_number=0):
     """Create animated test pattern with proper stride - OPTIMIZED"""
     try:
-        # Create output buffer with proper stride
-        output_buffer = np.zeros((PROJECTOR_HEIGHT, STRIDE_BYTES_PER_LINE), dtype=np.uint8)
-        
-        # Create coordinate arrays for vectorized operations
-        x_coords = np.arange(PROJECTOR_WIDTH)
-        y_coords = np.arange(PROJECTOR_HEIGHT)
+        # Reuse the frame buffer with proper stride
+        output_buffer = frame_buffer
         
-        # Create RGB values using vectorized operations
-        r_values = (x_coords * 255 + frame_number * 10) % 256
-        g_values = (y_coords * 255 + frame_number * 15) % 256
+        # Offset the precomputed column/row values for this frame; uint8
+        # addition wraps around, which is the same as % 256
+        r_values = test_pattern_r_base + np.uint8(frame_number * 10 % 256)
+        g_values = test_pattern_g_base + np.uint8(frame_number * 15 % 256)
         b_values = (128 + frame_number * 20) % 256
         
-        # Fill the buffer with BGR data
-        for y in range(PROJECTOR_HEIGHT):
-            # Copy BGR data in one operation
-            output_buffer[y, 0:DATA_BYTES_PER_LINE:3] = b_values  # B
-            output_buffer[y, 1:DATA_BYTES_PER_LINE:3] = g_values[y]  # G
-            output_buffer[y, 2:DATA_BYTES_PER_LINE:3] = r_values  # R
+        # Fill the buffer with BGR data, broadcasting columns and rows
+        output_buffer[:, 0:DATA_BYTES_PER_LINE:3] = b_values  # B
+        output_buffer[:, 1:DATA_BYTES_PER_LINE:3] = g_values[:, None]  # G
+        output_buffer[:, 2:DATA_BYTES_PER_LINE:3] = r_values[None, :]  # R
         
-        # Padding is already zeros from np.zeros()
+        # Padding is already zeros from the frame buffer allocation
         
-        return output_buffer.tobytes()
+        return output_buffer
     except Exception as e:
         print(f"Error creating test pattern: {e}")
         return None
 
 def create_error_pattern(frame_number=0):
     """Create a simple error pattern for when screen capture fails."""
+    global error_pattern_buffer
+    
     try:
-        output_buffer = np.zeros((PROJECTOR_HEIGHT, STRIDE_BYTES_PER_LINE), dtype=np.uint8)
-        
-        # Create a simple red pattern
-        for y in range(PROJECTOR_HEIGHT):
-            output_buffer[y, 0:DATA_BYTES_PER_LINE:3] = 255 # Red
-            output_buffer[y, 1:DATA_BYTES_PER_LINE:3] = 0   # Green
-            output_buffer[y, 2:DATA_BYTES_PER_LINE:3] = 0   # Blue
+        if error_pattern_buffer is None:
+            # Own buffer rather than frame_buffer, so the cached frame is not
+            # overwritten by the other producers
+            output_buffer = np.zeros((PROJECTOR_HEIGHT, STRIDE_BYTES_PER_LINE), dtype=np.uint8)
+            
+            # Create a simple red pattern (BGR order); padding stays zeros
+            output_buffer[:, 2:DATA_BYTES_PER_LINE:3] = 255  # Red
+            error_pattern_buffer = output_buffer
         
-        return output_buffer.tobytes()
+        return error_pattern_buffer
     except Exception as e:
         print(f"Error creating error pattern: {e}")
         return None
 
-def write_to_file(data, filename="/tmp/gm12u320_image.rgb", verbose=True):
-    """Write data to file with validation - OPTIMIZED"""
+def init_output_map(filename=OUTPUT_FILE):
+    """Open the output file once and mmap it so frames are copied in place"""
+    global output_fd, output_map, output_map_file
+    
+    cleanup_output_map()
     try:
-        # Use direct write without flush/fsync for better performance
-        with open(filename, 'wb') as f:
-            f.write(data)
-            # Only flush if verbose (for debugging)
-            if verbose:
-                f.flush()
-                os.fsync(f.fileno())
+        output_fd = os.open(filename, os.O_RDWR | os.O_CREAT, 0o666)
+        os.ftruncate(output_fd, TOTAL_FILE_SIZE)
+        output_map = mmap.mmap(output_fd, TOTAL_FILE_SIZE, mmap.MAP_SHARED,
+                               mmap.PROT_READ | mmap.PROT_WRITE)
+        output_map_file = filename
+        return True
+    except Exception as e:
+        print(f"Error mapping output file: {e}")
+        cleanup_output_map()
+        return False
+
+def cleanup_output_map():
+    """Unmap and close the output file"""
+    global output_fd, output_map, output_map_file
+    
+    if output_map is not None:
+        output_map.close()
+        output_map = None
+    if output_fd >= 0:
+        os.close(output_fd)
+        output_fd = -1
+    output_map_file = None
+
+def write_to_file(data, filename=OUTPUT_FILE, verbose=True, durable=False):
+    """Write data to the mapped output file with validation - OPTIMIZED"""
+    try:
+        # Map the file on first use, or again if the file or resolution changed
+        if output_map is None or output_map_file != filename or len(output_map) != TOTAL_FILE_SIZE:
+            if not init_output_map(filename):
+                return False
         
-        # Only validate file size if verbose
+        # Accept any buffer (bytes or the producers' numpy arrays) without
+        # serializing it to an intermediate bytes object first
+        frame = memoryview(data).cast('B')
+        if frame.nbytes != TOTAL_FILE_SIZE:
+            print(f"Data size mismatch: expected {TOTAL_FILE_SIZE}, got {frame.nbytes}")
+            return False
+        
+        # Copy the frame straight into the mapping: no open/truncate/write per frame
+        output_map[:] = frame
+        
+        # The driver reads the page cache directly, so syncing to disk only
+        # matters if the frame must survive a reboot
+        if durable:
+            output_map.flush()
+        
+        # Only validate file size if verbose (for debugging)
         if verbose:
             file_size = os.path.getsize(filename)
             print(f"File written: {filename}")
@@ -405,13 +627,11 @@ def main():
                 source_file = arg2
                 print(f"\n📷 Modo: Imagen estática")
                 print(f"   Archivo: {arg2}")
-                print(f"   FPS: {fps}")
         else:
             print(f"❌ Segundo argumento inválido: {arg2}")
             print("\nUso:")
             print("  python3 show_image.py 24 screen    # Captura de pantalla a 24 FPS")
             print("  python3 show_image.py 30 screen     # Captura de pantalla a 30 FPS")
-            print("  python3 show_image.py 10 imagen.jpg # Imagen a 10 FPS")
             return 1
     else:
         print("❌ Demasiados argumentos")
@@ -430,7 +650,9 @@ def main():
     
     # Calculate frame interval
     frame_interval = 1.0 / fps
-    print(f"   Intervalo: {frame_interval:.3f} segundos")
+    if mode != "image":
+        # Image mode sends a single frame, so no refresh interval applies
+        print(f"   Intervalo: {frame_interval:.3f} segundos")
     print("   Presiona Ctrl+C para detener\n")
     
     # Load content based on mode
@@ -440,6 +662,7 @@ def main():
     video_fps = None
     video_total_frames = 0
     video_frame_number = 0
+    capture_thread = None
     
     if mode == "image":
         image = load_image_from_path(source_file)
@@ -447,7 +670,7 @@ def main():
             resized_image = resize_image(image, PROJECTOR_WIDTH, PROJECTOR_HEIGHT)
             if resized_image:
                 static_data = create_rgb_buffer_with_stride(resized_image, verbose=False)
-                if static_data:
+                if static_data is not None:
                     use_static_image = True
         if not use_static_image:
             print("⚠️  No se pudo cargar la imagen, usando patrón de prueba")
@@ -472,28 +695,43 @@ def main():
                     print(f"   Usando FPS del video: {fps:.2f}")
     elif mode == "screen":
         print("📸 Capturando pantalla principal...")
-        # Will capture continuously in the loop
+        # Capture and resize run in a background thread; the loop packs and writes
+        capture_queue = queue.Queue(maxsize=1)
+        capture_request = threading.Event()
+        capture_stop = threading.Event()
+        capture_thread = threading.Thread(target=screen_capture_worker,
+                                          args=(capture_queue, capture_request, capture_stop),
+                                          daemon=True)
+        capture_thread.start()
+        capture_request.set()
     
     # Main refresh loop
     frame_count = 0
-    start_time = time.time()
+    start_time = time.monotonic()
+    next_deadline = start_time
     
     try:
         while True:
-            frame_start = time.time()
             data = None
             
             if mode == "screen":
-                # Capture screen continuously
-                image = capture_screen_with_retry(max_retries=1)
-                if image is not None:
-                    resized_image = resize_image(image, PROJECTOR_WIDTH, PROJECTOR_HEIGHT)
-                    if resized_image is not None:
-                        data = create_rgb_buffer_with_stride(resized_image, verbose=False)
-                        if data and write_to_file(data, verbose=False):
-                            frame_count += 1
-                            if frame_count % 10 == 0:
-                                monitor_performance(frame_count, start_time, image.size)
+                # Take the latest captured and resized frame from the capture thread;
+                # wait at least two intervals so a slow grab is not counted as failed
+                try:
+                    screen_size, resized_image = capture_queue.get(timeout=max(1.0, 2 * frame_interval))
+                    # Start grabbing the next frame while this one is written
+                    capture_request.set()
+                except queue.Empty:
+                    screen_size, resized_image = None, None
+                if resized_image is not None:
+                    # Screen arrays come from mss in BGRA order
+                    data = create_rgb_buffer_with_stride(
+                        resized_image, verbose=False,
+                        src_is_bgr=isinstance(resized_image, np.ndarray))
+                    if data is not None and write_to_file(data, verbose=False):
+                        frame_count += 1
+                        if frame_count % 10 == 0:
+                            monitor_performance(frame_count, start_time, screen_size)
                 else:
                     print("⚠️  Captura fallida, reintentando...")
                     
@@ -502,13 +740,14 @@ def main():
                 if video_cap and video_cap.isOpened():
                     ret, frame = video_cap.read()
                     if ret:
-                        # Convert BGR to RGB
-                        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                        image = Image.fromarray(frame_rgb)
-                        resized_image = resize_image(image, PROJECTOR_WIDTH, PROJECTOR_HEIGHT)
-                        if resized_image:
-                            data = create_rgb_buffer_with_stride(resized_image, verbose=False)
-                            if data and write_to_file(data, verbose=False):
+                        # Resize with OpenCV first so packing only touches
+                        # projector-sized frames
+                        resized_frame = resize_frame(frame, PROJECTOR_WIDTH, PROJECTOR_HEIGHT)
+                        if resized_frame is not None:
+                            # OpenCV frames are already BGR, the output order:
+                            # pack them as-is, no color conversion
+                            data = create_rgb_buffer_with_stride(resized_frame, verbose=False, src_is_bgr=True)
+                            if data is not None and write_to_file(data, verbose=False):
                                 frame_count += 1
                                 video_frame_number += 1
                                 if frame_count % 30 == 0:
@@ -521,48 +760,63 @@ def main():
                         print("🔄 Video reiniciado")
                         
             elif mode == "image":
-                # Static image
-                if static_data:
+                # Static image: the mapped file keeps the frame, so write it once
+                # and block until Ctrl+C instead of rewriting it every tick
+                if static_data is not None:
                     data = static_data
                     if write_to_file(data, verbose=False):
                         frame_count += 1
-                        if frame_count % 10 == 0:
-                            monitor_performance(frame_count, start_time)
+                        print("🖼️  Imagen enviada al proyector")
+                        # signal.pause() is POSIX-only; elsewhere sleep until Ctrl+C
+                        if hasattr(signal, 'pause'):
+                            signal.pause()
+                        else:
+                            while True:
+                                time.sleep(3600)
                             
             else:  # mode == "test"
                 # Test pattern
                 data = create_test_pattern(frame_count)
-                if data and write_to_file(data, verbose=False):
+                if data is not None and write_to_file(data, verbose=False):
                     frame_count += 1
                     if frame_count % 10 == 0:
                         monitor_performance(frame_count, start_time)
             
-            # Calculate sleep time to maintain FPS
-            frame_time = time.time() - frame_start
-            sleep_time = max(0, frame_interval - frame_time)
-            
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            # Sleep until an absolute deadline so timing errors do not add up;
+            # when running late, restart from now instead of bursting to catch up
+            next_deadline += frame_interval
+            now = time.monotonic()
+            if now < next_deadline:
+                time.sleep(next_deadline - now)
+            else:
+                next_deadline = now
             
     except KeyboardInterrupt:
         print("\n\n⏹️  Deteniendo...")
         
         # Cleanup
+        if capture_thread:
+            capture_stop.set()
+            capture_request.set()
+            capture_thread.join(timeout=2.0)
         if video_cap:
             video_cap.release()
         
+        cleanup_output_map()
         try:
-            os.remove("/tmp/gm12u320_image.rgb")
+            os.remove(OUTPUT_FILE)
         except:
             pass
         
         # Final stats
-        total_time = time.time() - start_time
+        total_time = time.monotonic() - start_time
         final_fps = frame_count / total_time if total_time > 0 else 0
         print(f"📊 Estadísticas finales:")
         print(f"   Frames: {frame_count}")
         print(f"   Tiempo: {total_time:.1f}s")
-        print(f"   FPS promedio: {final_fps:.1f}")
+        # Image mode sends a single frame, so an average FPS is meaningless
+        if mode != "image":
+            print(f"   FPS promedio: {final_fps:.1f}")
         
         if mode == "video":
             print(f"   Video reproducido: {video_frame_number} frames")